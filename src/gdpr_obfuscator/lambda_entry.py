@@ -1,7 +1,7 @@
 import os
 import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 import boto3
 
 from . import s3_adapter
@@ -9,13 +9,23 @@ from . import s3_adapter
 logger = logging.getLogger(__name__)
 logger.setLevel(os.getenv("LOG_LEVEL", "INFO"))
 
+# Module-level cache so warm Lambda invocations reuse the Secrets Manager
+# client and skip repeated GetSecretValue round-trips for the same secret.
+_secrets_client: Optional[Any] = None
+_cached_secret: Optional[Tuple[str, Optional[str]]] = None
+
 
 def get_secret_string(secret_name: Optional[str]) -> Optional[str]:
+    global _secrets_client, _cached_secret
     if not secret_name:
         return None
-    client = boto3.client("secretsmanager")
-    resp = client.get_secret_value(SecretId=secret_name)
+    if _cached_secret is not None and _cached_secret[0] == secret_name:
+        return _cached_secret[1]
+    if _secrets_client is None:
+        _secrets_client = boto3.client("secretsmanager")
+    resp = _secrets_client.get_secret_value(SecretId=secret_name)
     secret_value: Optional[str] = resp.get("SecretString")  # type: ignore[assignment]
+    _cached_secret = (secret_name, secret_value)
     return secret_value
 
 
@@ -2,18 +2,78 @@
 Core obfuscation logic with multi-format support via adapter pattern.
 """
 
-import hmac
 import hashlib
 import os
 import logging
-from typing import List, IO, Optional
-from io import BytesIO
+from typing import Callable, Dict, List, IO, Optional, Tuple, Union, cast
 
-from .format_adapters import get_adapter
+from .format_adapters import CSVAdapter, get_adapter
 
 logger = logging.getLogger(__name__)
 KEY_ENV = "OBFUSCATOR_KEY"
 
+# BLAKE2b accepts keys up to 64 bytes; longer keys are truncated.
+_MAX_KEY_BYTES = 64
+
+# Optional token-hash backend selection. blake2b (stdlib, default) is
+# the token-format contract; OBFUSCATOR_HASH=blake3 switches to the
+# blake3 package when installed, whose SIMD implementation has a lower
+# per-call constant factor. Tokens are deterministic within a backend
+# but differ between backends, so the flag must be consistent across
+# runs that need matching tokens.
+_HASH_ENV = "OBFUSCATOR_HASH"
+
+# BLAKE3 requires exactly 32 key bytes; shorter keys are zero-padded.
+_BLAKE3_KEY_BYTES = 32
+
+# Upper bound on memoized token tuples per row obfuscator. Unique-pk
+# files (the common case) get no cache hits, so without a cap the cache
+# would grow with the row count and peak memory would scale with file
+# size instead of buffer size.
+_PK_CACHE_MAX = 65536
+
+# digest_fn(data, key, digest_size) -> hex digest; key_prep(key) -> key
+# in the backend's required form.
+_DigestFn = Callable[[bytes, bytes, int], str]
+_KeyPrep = Callable[[bytes], bytes]
+
+
+def _hash_backend() -> Tuple[_DigestFn, _KeyPrep]:
+    """
+    Resolve the token hash backend from the environment.
+
+    Returns (digest_fn, key_prep): digest_fn(data, key, digest_size)
+    yields a hex digest of 2*digest_size chars, and key_prep normalizes
+    a raw key to the backend's required form. Falls back to blake2b when
+    blake3 is requested but not installed.
+    """
+    if os.getenv(_HASH_ENV) == "blake3":
+        try:
+            from blake3 import blake3  # type: ignore[import-not-found]
+        except ImportError:
+            logger.warning(
+                "%s=blake3 but the blake3 package is not installed; "
+                "falling back to blake2b",
+                _HASH_ENV,
+            )
+        else:
+
+            def digest_b3(data: bytes, key: bytes, digest_size: int) -> str:
+                return blake3(data, key=key).hexdigest(length=digest_size)
+
+            def prep_b3(key: bytes) -> bytes:
+                return key[:_BLAKE3_KEY_BYTES].ljust(_BLAKE3_KEY_BYTES, b"\x00")
+
+            return digest_b3, prep_b3
+
+    def digest_b2(data: bytes, key: bytes, digest_size: int) -> str:
+        return hashlib.blake2b(data, key=key, digest_size=digest_size).hexdigest()
+
+    def prep_b2(key: bytes) -> bytes:
+        return key[:_MAX_KEY_BYTES]
+
+    return digest_b2, prep_b2
+
 
 def _get_key() -> bytes:
     """Retrieve obfuscation key from environment."""
@@ -36,12 +96,23 @@ def obfuscate_value(
     """
     Return obfuscated representation for a single field value.
 
+    Tokens are keyed BLAKE2b digests over pk|field. BLAKE2b is natively
+    keyed (no HMAC double-hash construction), runs entirely in C, and
+    emits exactly the number of bytes needed for the requested token
+    length. Note: this token format replaced the earlier HMAC-SHA256
+    scheme, so tokens differ from those produced by older releases.
+
+    This is the single-value API; stream processing goes through
+    _make_row_obfuscator, which hoists the key slice, digest size and
+    encoded field suffixes out of the row loop and memoizes token
+    tuples per primary key.
+
     Args:
-        key: Secret key for HMAC
+        key: Secret key for the keyed digest (truncated to 64 bytes)
         primary_value: Value of primary key field (for deterministic hashing)
         field_name: Name of the field being obfuscated
         length: Length of hex token (when mode='token')
-        mode: 'token' (deterministic HMAC) or 'mask' (fixed string)
+        mode: 'token' (deterministic keyed digest) or 'mask' (fixed string)
         mask_token: String to use when mode='mask'
 
     Returns:
@@ -50,16 +121,96 @@ def obfuscate_value(
     if mode == "mask":
         return mask_token
 
-    # Deterministic HMAC-based token
+    # Deterministic keyed-digest token
     if primary_value is None:
         primary_value = ""
 
-    hm = hmac.new(key, digestmod=hashlib.sha256)
-    hm.update(primary_value.encode("utf-8"))
-    hm.update(b"|")
-    hm.update(field_name.encode("utf-8"))
+    digest_fn, key_prep = _hash_backend()
+    hex_token = digest_fn(
+        primary_value.encode("utf-8") + b"|" + field_name.encode("utf-8"),
+        key_prep(key),
+        (length + 1) // 2,
+    )
+
+    # digest_size already matches the token length; slicing is only needed
+    # to trim the extra nibble of an odd-length token.
+    return hex_token if len(hex_token) == length else hex_token[:length]
+
 
-    return hm.hexdigest()[:length]
+def _make_row_obfuscator(
+    key: bytes,
+    sensitive_fields: List[str],
+    mode: str = "token",
+    mask_token: str = "***",  # nosec B107
+    token_length: int = 16,
+) -> Callable[[Union[str, bytes]], Tuple[str, ...]]:
+    """
+    Build a row-level obfuscation callback.
+
+    The returned function takes a primary key value - str, or already
+    UTF-8-encoded bytes from the byte-level scanner - and returns one
+    token per entry of sensitive_fields, in order. Accepting bytes lets
+    the fast scan path feed raw pk slices without a decode/encode
+    round-trip per row. Each token is a single C call:
+    the pk|field payload is concatenated once and handed to the keyed
+    digest (blake2b, or blake3 when selected via OBFUSCATOR_HASH)
+    instead of crossing the Python/C boundary with separate update()
+    calls. The |field suffixes are
+    pre-encoded, and token tuples are memoized per pk (bounded at
+    _PK_CACHE_MAX entries, dropped wholesale when full) so repeated
+    primary keys skip the digest without letting unique-pk files grow
+    the cache with the row count.
+
+    Tokens are bit-identical to what obfuscate_value produces for the
+    same (key, pk, field) inputs.
+    """
+    if mode == "mask":
+        constant = (mask_token,) * len(sensitive_fields)
+
+        def obfuscate_row_mask(pk_value: Union[str, bytes]) -> Tuple[str, ...]:
+            return constant
+
+        # Advertise the constant so adapters can assign it directly and
+        # skip pk extraction plus the per-row callback entirely.
+        obfuscate_row_mask.constant_tokens = constant  # type: ignore[attr-defined]
+        return obfuscate_row_mask
+
+    digest_size = (token_length + 1) // 2
+    digest_fn, key_prep = _hash_backend()
+    key = key_prep(key)
+    field_suffixes = [b"|" + f.encode("utf-8") for f in sensitive_fields]
+    pk_cache: Dict[Union[str, bytes], Tuple[str, ...]] = {}
+
+    # digest_size emits exactly token_length hex chars for even lengths;
+    # only odd lengths need the one-nibble trim.
+    trim = token_length % 2 == 1
+
+    def obfuscate_row(pk_value: Union[str, bytes]) -> Tuple[str, ...]:
+        tokens = pk_cache.get(pk_value)
+        if tokens is None:
+            if isinstance(pk_value, bytes):
+                pk_bytes = pk_value
+            else:
+                pk_bytes = (pk_value or "").encode("utf-8")
+            if trim:
+                tokens = tuple(
+                    digest_fn(pk_bytes + suffix, key, digest_size)[:token_length]
+                    for suffix in field_suffixes
+                )
+            else:
+                tokens = tuple(
+                    digest_fn(pk_bytes + suffix, key, digest_size)
+                    for suffix in field_suffixes
+                )
+            # Clear-on-threshold beats LRU bookkeeping here: eviction
+            # order is irrelevant for a deterministic digest, and the
+            # branch costs nothing on the hot path.
+            if len(pk_cache) >= _PK_CACHE_MAX:
+                pk_cache.clear()
+            pk_cache[pk_value] = tokens
+        return tokens
+
+    return obfuscate_row
 
 
 def obfuscate_stream(
@@ -113,16 +264,13 @@ def obfuscate_stream(
     # This will raise NotImplementedError for JSON/Parquet
     adapter = get_adapter(file_format)
 
-    # Create obfuscation function with closure over key and parameters
-    def obfuscate_fn(pk_value: str, field_name: str) -> str:
-        return obfuscate_value(
-            key=key,
-            primary_value=pk_value,
-            field_name=field_name,
-            length=token_length,
-            mode=mode,
-            mask_token=mask_token,
-        )
+    obfuscate_row = _make_row_obfuscator(
+        key=key,
+        sensitive_fields=sensitive_fields,
+        mode=mode,
+        mask_token=mask_token,
+        token_length=token_length,
+    )
 
     # Delegate to format-specific adapter
     count = adapter.process_stream(
@@ -130,7 +278,7 @@ def obfuscate_stream(
         output_stream=output_stream,
         sensitive_fields=sensitive_fields,
         primary_key_field=primary_key_field,
-        obfuscate_fn=obfuscate_fn,
+        obfuscate_row=obfuscate_row,
     )
 
     logger.info(
@@ -158,24 +306,29 @@ def obfuscate_csv_stream(
     """
     Legacy CSV-specific function for backward compatibility.
 
-    This wraps text streams in BytesIO and calls the universal obfuscate_stream.
-    Kept to avoid breaking existing code that uses this function.
+    Streams through the CSV adapter's text path directly, so the input is
+    never materialized into an in-memory byte buffer. Kept to avoid
+    breaking existing code that uses this function.
     """
-    # Convert text streams to byte streams
-    input_bytes = BytesIO(input_stream.read().encode("utf-8"))
-    output_bytes = BytesIO()
+    if key is None:
+        key = _get_key()
 
-    obfuscate_stream(
-        input_stream=input_bytes,
-        output_stream=output_bytes,
-        sensitive_fields=sensitive_fields,
-        file_format="csv",
-        primary_key_field=primary_key_field,
+    # process_text is CSV-specific, so dispatch through a CSVAdapter-typed
+    # reference rather than the FormatAdapter base returned by get_adapter.
+    adapter = cast(CSVAdapter, get_adapter("csv"))
+
+    obfuscate_row = _make_row_obfuscator(
         key=key,
+        sensitive_fields=sensitive_fields,
         mode=mode,
         mask_token=mask_token,
         token_length=token_length,
     )
 
-    # Write result back to text stream
-    output_stream.write(output_bytes.getvalue().decode("utf-8"))
+    adapter.process_text(
+        input_stream,
+        output_stream,
+        sensitive_fields=sensitive_fields,
+        primary_key_field=primary_key_field,
+        obfuscate_row=obfuscate_row,
+    )
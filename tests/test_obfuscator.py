@@ -12,6 +12,37 @@ def test_obfuscate_value_is_deterministic():
     assert len(a) == 16
 
 
+def test_obfuscate_value_blake3_backend(monkeypatch):
+    import pytest
+
+    pytest.importorskip("blake3")
+    key = b"testkey"
+
+    monkeypatch.setenv("OBFUSCATOR_HASH", "blake3")
+    a = obfuscate_value(key, "123", "email")
+    b = obfuscate_value(key, "123", "email")
+    assert a == b
+    assert len(a) == 16
+
+    # backends produce different token streams; default remains blake2b
+    monkeypatch.delenv("OBFUSCATOR_HASH")
+    assert obfuscate_value(key, "123", "email") != a
+
+
+def test_row_obfuscator_tokens_survive_cache_eviction(monkeypatch):
+    """Tokens stay correct when unique pks overflow the bounded cache."""
+    from gdpr_obfuscator import obfuscator
+    from gdpr_obfuscator.obfuscator import _make_row_obfuscator
+
+    monkeypatch.setattr(obfuscator, "_PK_CACHE_MAX", 4)
+    key = b"testkey"
+    obfuscate_row = _make_row_obfuscator(key, ["email"])
+
+    # 10 distinct pks force several clear-on-threshold evictions.
+    for pk in [str(i) for i in range(10)] + ["3", "7"]:
+        assert obfuscate_row(pk) == (obfuscate_value(key, pk, "email"),)
+
+
 def test_obfuscate_value_changes_with_field():
     key = b"testkey"
     a = obfuscate_value(key, "123", "email")
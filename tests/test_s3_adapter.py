@@ -1,5 +1,7 @@
 import io
-from botocore.stub import Stubber
+import threading
+
+from botocore.stub import ANY, Stubber
 
 # import the function and the client from your module
 from gdpr_obfuscator import s3_adapter
@@ -16,7 +18,7 @@ def test_process_s3_csv_to_bytes(monkeypatch):
     monkeypatch.setenv("OBFUSCATOR_KEY", "testkey")
 
     # Prepare stubbed S3 client response: Body as BytesIO
-    client = s3_adapter.s3  # this is the boto3 client used by the module
+    client = s3_adapter._get_default_client()
     stub = Stubber(client)
 
     # S3 get_object response with Body as BytesIO
@@ -45,3 +47,307 @@ def test_process_s3_csv_to_bytes(monkeypatch):
     # header and id should remain
     assert "id" in txt
     assert "Alice" in txt
+
+
+def test_ranged_get_iter_reassembles_object_in_order():
+    client = s3_adapter._get_default_client()
+    stub = Stubber(client)
+
+    body = SAMPLE_CSV.encode("utf-8")
+    part_size = 32
+    for start in range(0, len(body), part_size):
+        stop = min(start + part_size, len(body))
+        end = stop - 1
+        stub.add_response(
+            "get_object",
+            {"Body": io.BytesIO(body[start:stop])},
+            {
+                "Bucket": "my-bucket",
+                "Key": "path/to/file.csv",
+                "Range": f"bytes={start}-{end}",
+            },
+        )
+
+    stub.activate()
+    try:
+        # concurrency=1 keeps the stubbed responses consumed in order
+        chunks = list(
+            s3_adapter._ranged_get_iter(
+                client,
+                "my-bucket",
+                "path/to/file.csv",
+                len(body),
+                part_size=part_size,
+                concurrency=1,
+            )
+        )
+    finally:
+        stub.deactivate()
+
+    assert len(chunks) > 1
+    assert b"".join(chunks) == body
+    # the wrapper stream should expose the chunks as one readable stream
+    assert s3_adapter._ChunkStream(iter(chunks)).read() == body
+
+
+def test_body_stream_unwraps_raw_stream_only_when_enabled(monkeypatch):
+    class FakeRaw(io.BytesIO):
+        decode_content = False
+
+    class FakeBody:
+        def __init__(self):
+            self._raw_stream = FakeRaw(b"data")
+
+    resp = {"Body": FakeBody()}
+
+    monkeypatch.delenv("OBFUSCATOR_RAW_STREAM", raising=False)
+    assert s3_adapter._body_stream(resp) is resp["Body"]
+
+    monkeypatch.setenv("OBFUSCATOR_RAW_STREAM", "1")
+    raw = s3_adapter._body_stream(resp)
+    assert raw is resp["Body"]._raw_stream
+    assert raw.decode_content is True
+
+    # bodies without a private raw stream (e.g. stubbed BytesIO) pass through
+    plain = {"Body": io.BytesIO(b"data")}
+    assert s3_adapter._body_stream(plain) is plain["Body"]
+
+
+def test_ranged_get_iter_hedges_slow_ranges(monkeypatch):
+    monkeypatch.setattr(s3_adapter, "_HEDGE_TIMEOUT", 0.05)
+
+    calls = []
+    release = threading.Event()
+
+    class StallingClient:
+        def get_object(self, Bucket, Key, Range):
+            calls.append(Range)
+            if len(calls) == 1:
+                release.wait(timeout=5)  # first attempt stalls
+            else:
+                release.set()  # hedge request completes and frees it
+            return {"Body": io.BytesIO(b"DATA")}
+
+    chunks = list(
+        s3_adapter._ranged_get_iter(
+            StallingClient(), "my-bucket", "key", 4, part_size=4, concurrency=2
+        )
+    )
+
+    assert b"".join(chunks) == b"DATA"
+    # the slow range was fetched twice: original plus hedge
+    assert calls == ["bytes=0-3", "bytes=0-3"]
+
+
+def test_process_s3_file_to_bytes_with_ranged_download(monkeypatch):
+    monkeypatch.setenv("OBFUSCATOR_KEY", "testkey")
+
+    client = s3_adapter._get_default_client()
+    stub = Stubber(client)
+
+    body = SAMPLE_CSV.encode("utf-8")
+    stub.add_response(
+        "head_object",
+        {"ContentLength": len(body)},
+        {"Bucket": "my-bucket", "Key": "path/to/file.csv"},
+    )
+    stub.add_response(
+        "get_object",
+        {"Body": io.BytesIO(body)},
+        {
+            "Bucket": "my-bucket",
+            "Key": "path/to/file.csv",
+            "Range": f"bytes=0-{len(body) - 1}",
+        },
+    )
+
+    stub.activate()
+    try:
+        result = s3_adapter.process_s3_file_to_bytes(
+            "s3://my-bucket/path/to/file.csv",
+            sensitive_fields=["email", "phone"],
+            primary_key_field="id",
+            concurrency=4,
+        )
+    finally:
+        stub.deactivate()
+
+    txt = result.decode("utf-8")
+    assert "alice@example.com" not in txt
+    assert "Alice" in txt
+
+
+def test_process_and_upload_small_file_uses_put_object(monkeypatch):
+    monkeypatch.setenv("OBFUSCATOR_KEY", "testkey")
+
+    client = s3_adapter._get_default_client()
+    stub = Stubber(client)
+
+    stub.add_response(
+        "get_object",
+        {"Body": io.BytesIO(SAMPLE_CSV.encode("utf-8"))},
+        {"Bucket": "in-bucket", "Key": "raw/data.csv"},
+    )
+    # output fits in one part, so the upload is a single put_object
+    stub.add_response(
+        "put_object",
+        {},
+        {"Bucket": "out-bucket", "Key": "obf/data.csv", "Body": ANY},
+    )
+
+    stub.activate()
+    try:
+        s3_adapter.process_and_upload(
+            source_s3_uri="s3://in-bucket/raw/data.csv",
+            target_s3_uri="s3://out-bucket/obf/data.csv",
+            sensitive_fields=["email", "phone"],
+            primary_key_field="id",
+        )
+        stub.assert_no_pending_responses()
+    finally:
+        stub.deactivate()
+
+
+def test_multipart_upload_stream_uploads_parts_in_order():
+    client = s3_adapter._get_default_client()
+    stub = Stubber(client)
+
+    stub.add_response(
+        "create_multipart_upload",
+        {"UploadId": "upload-1"},
+        {"Bucket": "out-bucket", "Key": "big.csv"},
+    )
+    for part_number in (1, 2):
+        stub.add_response(
+            "upload_part",
+            {"ETag": f"etag-{part_number}"},
+            {
+                "Bucket": "out-bucket",
+                "Key": "big.csv",
+                "PartNumber": part_number,
+                "UploadId": "upload-1",
+                "Body": ANY,
+            },
+        )
+    stub.add_response(
+        "complete_multipart_upload",
+        {},
+        {
+            "Bucket": "out-bucket",
+            "Key": "big.csv",
+            "UploadId": "upload-1",
+            "MultipartUpload": {
+                "Parts": [
+                    {"ETag": "etag-1", "PartNumber": 1},
+                    {"ETag": "etag-2", "PartNumber": 2},
+                ]
+            },
+        },
+    )
+
+    stub.activate()
+    try:
+        # max_workers=1 keeps the stubbed responses consumed in order
+        writer = s3_adapter._MultipartUploadStream(
+            client, "out-bucket", "big.csv", part_size=16, max_workers=1
+        )
+        writer.write(b"x" * 16)  # fills part 1 exactly
+        writer.write(b"y" * 4)  # tail becomes part 2 on finish
+        writer.finish()
+        stub.assert_no_pending_responses()
+    finally:
+        stub.deactivate()
+
+    assert writer.bytes_written == 20
+
+
+def test_multipart_upload_stream_applies_backpressure():
+    # More parts than the in-flight cap: the producer must block on the
+    # semaphore and resume as the (single) worker drains parts.
+    parts = 8
+    client = s3_adapter._get_default_client()
+    stub = Stubber(client)
+
+    stub.add_response(
+        "create_multipart_upload",
+        {"UploadId": "upload-2"},
+        {"Bucket": "out-bucket", "Key": "big.csv"},
+    )
+    for part_number in range(1, parts + 1):
+        stub.add_response(
+            "upload_part",
+            {"ETag": f"etag-{part_number}"},
+            {
+                "Bucket": "out-bucket",
+                "Key": "big.csv",
+                "PartNumber": part_number,
+                "UploadId": "upload-2",
+                "Body": ANY,
+            },
+        )
+    stub.add_response(
+        "complete_multipart_upload",
+        {},
+        {
+            "Bucket": "out-bucket",
+            "Key": "big.csv",
+            "UploadId": "upload-2",
+            "MultipartUpload": {
+                "Parts": [
+                    {"ETag": f"etag-{n}", "PartNumber": n} for n in range(1, parts + 1)
+                ]
+            },
+        },
+    )
+
+    stub.activate()
+    try:
+        writer = s3_adapter._MultipartUploadStream(
+            client, "out-bucket", "big.csv", part_size=8, max_workers=1
+        )
+        for _ in range(parts):
+            writer.write(b"x" * 8)
+        writer.finish()
+        stub.assert_no_pending_responses()
+    finally:
+        stub.deactivate()
+
+    assert writer.bytes_written == parts * 8
+
+
+def test_process_many_processes_all_pairs(monkeypatch):
+    monkeypatch.setenv("OBFUSCATOR_KEY", "testkey")
+
+    client = s3_adapter._get_default_client()
+    stub = Stubber(client)
+
+    for name in ("a", "b"):
+        stub.add_response(
+            "get_object",
+            {"Body": io.BytesIO(SAMPLE_CSV.encode("utf-8"))},
+            {"Bucket": "in-bucket", "Key": f"{name}.csv"},
+        )
+        stub.add_response(
+            "put_object",
+            {},
+            {"Bucket": "out-bucket", "Key": f"{name}.csv", "Body": ANY},
+        )
+
+    stub.activate()
+    try:
+        # concurrency=1 keeps the stubbed responses consumed in order
+        failures = s3_adapter.process_many(
+            [
+                ("s3://in-bucket/a.csv", "s3://out-bucket/a.csv"),
+                ("s3://in-bucket/b.csv", "s3://out-bucket/b.csv"),
+            ],
+            sensitive_fields=["email", "phone"],
+            primary_key_field="id",
+            s3_client=client,
+            concurrency=1,
+        )
+        stub.assert_no_pending_responses()
+    finally:
+        stub.deactivate()
+
+    assert failures == {}
@@ -2,49 +2,36 @@
 Generate a CSV with N rows for testing without external libs.
 Columns: id, full_name, email, phone, address, age
 """
-import csv
-import random
-import string
-
-
-def random_name(i: int) -> str:
-    return f"User{i} Test"
-
-
-def random_email(i: int) -> str:
-    return f"user{i}@example.com"
-
 
-def random_phone(i: int) -> str:
-    # simple phone
-    return f"+44{random.randint(700000000,799999999)}"
-
-
-def random_address(i: int) -> str:
-    return f"{i} Baker St, Town-{i % 1000}"
+import random
 
 
 def generate_csv(path: str, rows: int = 1_000_000, chunk: int = 100_000):
-    fieldnames = ["id", "full_name", "email", "phone", "address", "age"]
-    with open(path, "w", newline="", encoding="utf-8") as fout:
-        writer = csv.DictWriter(fout, fieldnames=fieldnames)
-        writer.writeheader()
-        for i in range(1, rows + 1):
-            writer.writerow({
-                "id": str(i),
-                "full_name": random_name(i),
-                "email": random_email(i),
-                "phone": random_phone(i),
-                "address": random_address(i),
-                "age": str(random.randint(18, 90)),
-            })
-            if i % chunk == 0:
-                print(f"Generated {i} rows")
-
+    # Column-wise batch generation: each chunk of rows is built as one
+    # list of preformatted lines and emitted with a single writelines()
+    # call, instead of a per-row dict plus DictWriter.writerow() a
+    # million times. Only the address field can contain a comma, so it
+    # is quoted inline and the csv module is not needed at all; the
+    # output is byte-identical to what DictWriter produced (CRLF line
+    # endings, minimal quoting).
+    randint = random.randint
+    with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as fout:
+        fout.write("id,full_name,email,phone,address,age\r\n")
+        for start in range(1, rows + 1, chunk):
+            stop = min(start + chunk, rows + 1)
+            fout.writelines(
+                f"{i},User{i} Test,user{i}@example.com,"
+                f"+44{randint(700000000, 799999999)},"
+                f'"{i} Baker St, Town-{i % 1000}",'
+                f"{randint(18, 90)}\r\n"
+                for i in range(start, stop)
+            )
+            print(f"Generated {stop - 1} rows")
 
 
 if __name__ == "__main__":
     # small safety default if run accidentally
     import sys
+
     n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
-    generate_csv("data.csv", rows=n)
\ No newline at end of file
+    generate_csv("data.csv", rows=n)